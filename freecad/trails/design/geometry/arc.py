@@ -850,23 +850,19 @@ def get_segments(bearing, deltas, direction, start, radius, _dtype=Vector):
     radius - arc radius
     """
 
-    _forward = Vector(math.sin(bearing), math.cos(bearing), 0.0)
-    _right = Vector(_forward.y, -_forward.x, 0.0)
+    _forward = numpy.array([math.sin(bearing), math.cos(bearing), 0.0])
+    _right = numpy.array([_forward[1], -_forward[0], 0.0])
 
-    _points = [_dtype(start)]
-    _start = Vector(start)
-
-    for delta in deltas:
+    _deltas = numpy.array(deltas, dtype=float).reshape(-1, 1)
 
-        _dfw = Vector(_forward).multiply(math.sin(delta))
-        _drt = Vector(_right).multiply(direction * (1.0 - math.cos(delta)))
+    #calculate all segment coordinates at once
+    _offsets = numpy.sin(_deltas) * _forward \
+        + direction * (1.0 - numpy.cos(_deltas)) * _right
 
-        _vec = _start.add(_dfw.add(_drt).multiply(radius))
+    _coords = numpy.array(tuple(start)) + _offsets * radius
 
-        if _dtype is not Vector:
-            _vec = _dtype(_vec)
-
-        _points.append(_vec)
+    _points = [_dtype(start)]
+    _points += [_dtype(_v) for _v in map(tuple, _coords.tolist())]
 
     return _points
 
@@ -24,6 +24,8 @@
 View state class
 """
 
+import numpy
+
 from pivy import coin
 from PySide import QtGui
 
@@ -128,39 +130,19 @@ class ViewState(metaclass=Singleton):
         if not _matrix:
             return []
 
-        #list of coin vectors requires conversion to tuples
+        #coin vectors are read by value, tuples and FreeCAD vectors are
+        #copied into the array directly as sequences
         if isinstance(points[0], coin.SbVec3f):
             points = [_v.getValue() for _v in points]
 
-        elif isinstance(points[0], Vector):
-            points = [tuple(_v) for _v in points]
-
-        #append fourth point to each coordinate
-        _pts = [_v + (1.0,) for _v in points]
-
-        _s = 0
-        _result = []
-
-        #iterate the list, processing it in sets of four coordinates at a time
-        while _s < len(_pts):
-
-            _mat_pts = _pts[_s:_s + 4]
-
-            _last_point = len(_mat_pts)
-
-            #pad the list if less than four points
-            for _i in range(len(_mat_pts), 4):
-                _mat_pts.append((0.0, 0.0, 0.0, 1.0))
-
-            #convert and transform
-            _mat = coin.SbMatrix(_mat_pts)
-
-            for _v in _mat.multRight(_matrix).getValue()[:_last_point]:
-                _result.append(tuple(_v))
+        #build homogeneous coordinates, one point per row
+        _pts = numpy.ones((len(points), 4))
+        _pts[:, :3] = points
 
-            _s += 4
+        #transform all points with a single row-vector matrix product
+        _result = _pts @ numpy.array(_matrix.getValue())
 
-        return _result
+        return list(map(tuple, _result.tolist()))
 
     def getPointOnScreen(self, point):
         """
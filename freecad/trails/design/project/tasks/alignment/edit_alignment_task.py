@@ -118,26 +118,32 @@ class EditAlignmentTask(Publisher, Subscriber): #lgtm [py/missing-call-to-init]
         #disable selection entirely
         ViewState().sg_root.getField("selectionRole").setValue(0)
 
-        #get all objects with LineColor and set them all to gray
-        ViewState().view_objects['line_colors'] = [
-            (_v.ViewObject, _v.ViewObject.LineColor)
-            for _v in self.doc.findObjects()
-            if hasattr(_v, 'ViewObject')
-            if hasattr(_v.ViewObject, 'LineColor')
-        ]
+        #get all objects with LineColor and all objects in the scene that
+        #are selectable in a single pass over the document
+        _line_colors = []
+        _selectable = []
 
-        for _v in ViewState().view_objects['line_colors']:
-            self.set_vobj_style(_v[0], self.STYLES.DISABLED)
+        for _v in self.doc.findObjects():
 
-        #get all objects in the scene that are selectable.
-        ViewState().view_objects['selectable'] = [
-            (_v.ViewObject, _v.ViewObject.Selectable)
-            for _v in self.doc.findObjects()
-            if hasattr(_v, 'ViewObject')
-            if hasattr(_v.ViewObject, 'Selectable')
-        ]
+            _vobj = getattr(_v, 'ViewObject', None)
+
+            if _vobj is None:
+                continue
+
+            if hasattr(_vobj, 'LineColor'):
+                _line_colors.append((_vobj, _vobj.LineColor))
+
+            if hasattr(_vobj, 'Selectable'):
+                _selectable.append((_vobj, _vobj.Selectable))
+
+        ViewState().view_objects['line_colors'] = _line_colors
+        ViewState().view_objects['selectable'] = _selectable
 
-        for _v in ViewState().view_objects['selectable']:
+        #set all line colors to gray
+        for _v in _line_colors:
+            self.set_vobj_style(_v[0], self.STYLES.DISABLED)
+
+        for _v in _selectable:
             _v[0].Selectable = False
 
         #deselect existing selections
@@ -157,7 +163,7 @@ class EditAlignmentTask(Publisher, Subscriber): #lgtm [py/missing-call-to-init]
             self.Object.Name, self.alignment
         )
 
-        self.alignment_tracker.insert_into_scenegraph(verbose=True)
+        self.alignment_tracker.insert_into_scenegraph()
 
         #save camera state
         _camera = ViewState().view.getCameraNode()
@@ -238,19 +244,18 @@ class EditAlignmentTask(Publisher, Subscriber): #lgtm [py/missing-call-to-init]
         _d_ht = (_height - _start_ht) / _frames
 
 
+        _view = ViewState().view
+
         for _v in _steps:
 
             #set the camera
-            ViewState().view.getCameraNode().position.setValue(
-                tuple(_start_pos + (_d_pos * _v))
-            )
+            _camera = _view.getCameraNode()
 
-            ViewState().view.getCameraNode().height.setValue(
-                _start_ht + (_d_ht * _v)
-            )
+            _camera.position.setValue(tuple(_start_pos + (_d_pos * _v)))
+            _camera.height.setValue(_start_ht + (_d_ht * _v))
 
             Gui.updateGui()
-            ViewState().view.redraw()
+            _view.redraw()
 
     def setup(self):
         """
@@ -354,20 +359,22 @@ class EditAlignmentTask(Publisher, Subscriber): #lgtm [py/missing-call-to-init]
         SoLocation2Event callback
         """
 
+        _mouse = self.mouse
+
         #force refresh the view matrix if dragging
-        self.mouse.update(arg, ViewState().view.getCursorPos())
+        _mouse.update(arg, ViewState().view.getCursorPos())
 
-        if MouseState().shiftDown:
+        if _mouse.shiftDown:
 
-            _dist = MouseState().vector.Length
+            _dist = _mouse.vector.Length
 
             if not _dist:
                 return
 
-            _vec = Vector(MouseState().vector).normalize()
+            _vec = Vector(_mouse.vector).normalize()
 
-            MouseState().set_mouse_position(
-                MouseState().last_coord.add(_vec.multiply(_dist * 0.10))
+            _mouse.set_mouse_position(
+                _mouse.last_coord.add(_vec.multiply(_dist * 0.10))
             )
 
     def button_event(self, arg):
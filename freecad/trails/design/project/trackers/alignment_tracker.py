@@ -64,7 +64,8 @@ class AlignmentTracker(ContextTracker):
                 indices = None), #list of PI indices
 
             points = None, #list of PI points
-            last_update = None  #last translation update
+            last_update = None,  #last translation update
+            curve_inputs = {}   #last pi / bearings applied to each curve
         )
 
         self.curve_trackers = []
@@ -77,11 +78,10 @@ class AlignmentTracker(ContextTracker):
         self.alignment_group = self.base.add_group('Alignment_Group')
 
         #build a list of coordinates from curves in the geometry
-        _nodes = [tuple(self.datum)]
-        _nodes += [tuple(_v.get('PI'))\
-            for _v in self.model.get('geometry') if _v.get('Type') != 'Line']
-
-        _nodes += [tuple(self.model.get('meta').get('End'))]
+        _nodes = [tuple(self.datum)]\
+            + [tuple(_v.get('PI')) for _v in self.model.get('geometry')
+                if _v.get('Type') != 'Line']\
+            + [tuple(self.model.get('meta').get('End'))]
 
         self.alignment_tracker =\
             PolyLineTracker('alignment', _nodes, self.alignment_group)
@@ -96,8 +96,9 @@ class AlignmentTracker(ContextTracker):
 
             for _m in _l.markers:
 
-                _m.name = f'PI_{str(_i).zfill(3)}'
-                _m.type_name += f'.Alignment.PI.{str(_i).zfill(3)}'
+                _id = str(_i).zfill(3)
+                _m.name = 'PI_' + _id
+                _m.type_name += '.Alignment.PI.' + _id
                 _i += 1
 
                 if not _j:
@@ -170,33 +171,28 @@ class AlignmentTracker(ContextTracker):
 
         #get distances between PI's except first and last
 
-        _pp = self.drag_refs.points[0]
-        _lines = []
+        _points = self.drag_refs.points
+        _lines = [
+            TupleMath.length(_p, _pp) for _pp, _p in zip(_points, _points[1:])
+        ]
+
         _curves = self.curve_trackers[
             self.drag_refs.curve_list[0]:self.drag_refs.curve_list[-1] +1]
 
-        for _p in self.drag_refs.points[1:]:
-            _lines.append(TupleMath.length(_p, _pp))
-            _pp = _p
-
         _prev = _curves[0]
         _prev.is_invalid = False
         _any_viz_invalid = False
 
-        for _i, _c in enumerate(_curves[1:]):
+        #test each curve pair once, accumulating the overall result as we go
+        for _c, _line, _next_line in zip(_curves[1:], _lines, _lines[1:]):
 
-            _c.is_invalid = False
+            _c.is_invalid =\
+                (_prev.arc.tangent + _c.arc.tangent) > _next_line
 
-            _invalid = [
-                _prev.is_invalid or _prev.arc.tangent > _lines[_i],
-                (_prev.arc.tangent + _c.arc.tangent) > _lines[_i + 1]
-            ]
+            _prev.is_invalid = _prev.is_invalid\
+                or _prev.arc.tangent > _line or _c.is_invalid
 
-            if not _any_viz_invalid:
-                _any_vizinvalid = any(_invalid)
-
-            _prev.is_invalid = any(_invalid)
-            _c.is_invalid = _invalid[1]
+            _any_viz_invalid = _any_viz_invalid or _prev.is_invalid
 
             _prev = _c
 
@@ -218,6 +214,11 @@ class AlignmentTracker(ContextTracker):
         Callback to set alignment behaviors for the DragTracker
         """
 
+        #abort as the drag references have already been built.  Curve
+        #trackers chain this callback, so it fires once per linked curve
+        if self.drag_refs.points:
+            return
+
         self.drag_refs.points = self.alignment_tracker.get_coordinates()
 
         Drag.drag_tracker.set_constraint_geometry()
@@ -235,9 +236,9 @@ class AlignmentTracker(ContextTracker):
         elif 'Curve'  in user_data.obj.type_name:
             _sel_pi = (_num + 1,)
 
-        #references to selected points
+        #references to selected points, indexed directly
         self.drag_refs.selected.pi = [self.drag_refs.points[_v] \
-                for _v in range(0, _count) if _v in _sel_pi]
+                for _v in _sel_pi if 0 <= _v < _count]
 
         self.drag_refs.selected.indices = _sel_pi
 
@@ -249,13 +250,12 @@ class AlignmentTracker(ContextTracker):
 
         #constrain the lists to valid ranges
         self.drag_refs.curve_list =\
-            tuple(_curve_list.intersection(set(range(0, _count-2))))
+            tuple(sorted(_v for _v in _curve_list if 0 <= _v < _count - 2))
 
         self.drag_refs.pi_list =\
-            tuple(sorted(_pi_list.intersection(set(range(0, _count)))))
+            tuple(sorted(_v for _v in _pi_list if 0 <= _v < _count))
 
-        _pi = (tuple(
-            self.drag_refs.pi_list)[0], tuple(self.drag_refs.pi_list)[-1]+1)
+        _pi = (self.drag_refs.pi_list[0], self.drag_refs.pi_list[-1] + 1)
 
         self.drag_refs.points =\
             self.drag_refs.points[_pi[0]:_pi[1]]
@@ -271,8 +271,10 @@ class AlignmentTracker(ContextTracker):
         #if curves are being directly adjusted, don't recalculate bearings
         if not  'Curve' in user_data.obj.type_name:
 
-            #pi change requires bearing update
-            self.rebuild_bearings(user_data.matrix, user_data.obj.name)
+            #pi change requires bearing update, skip validation if the
+            #points haven't moved since the last update
+            if not self.rebuild_bearings(user_data.matrix, user_data.obj.name):
+                return
 
         self.validate_curve_drag(None)
 
@@ -305,12 +307,14 @@ class AlignmentTracker(ContextTracker):
                 pi = None,
                 indices = None),
             points = None,
-            last_update = None
+            last_update = None,
+            curve_inputs = {}
         )
 
     def rebuild_bearings(self, matrix, obj_name):
         """
-        Recalculate bearings / update curves
+        Recalculate bearings / update curves.
+        Returns False if no movement has occurred since the last update
         """
 
         #capture point translation
@@ -318,7 +322,7 @@ class AlignmentTracker(ContextTracker):
 
         #abort if no movement has occurred
         if _xlate == self.drag_refs.last_update:
-            return
+            return False
 
         self.drag_refs.last_update = _xlate
 
@@ -326,31 +330,39 @@ class AlignmentTracker(ContextTracker):
             self.drag_refs.selected.pi, matrix)
 
         _points = self.drag_refs.points
-        _j = 0
 
         #update translated points
-        for _i in self.drag_refs.selected.indices:
-
-            _points[_i] = _p[_j]
-            _j += 1
+        for _i, _v in zip(self.drag_refs.selected.indices, _p):
+            _points[_i] = _v
 
-        #precalcualte bearings
-        _bearings = [TupleMath.bearing(
-            TupleMath.subtract(_points[_i+1], _v))\
-                for _i, _v in enumerate(_points[:-1])]
+        #precalcualte bearings between each pair of adjacent points
+        _bearings = [TupleMath.bearing(TupleMath.subtract(_v, _u))\
+            for _u, _v in zip(_points[:-1], _points[1:])]
 
         #iterate curves setting the bearing inbound / outbound pairs
         #drop the outermost curves as they are not being changed
-        _curves = [self.curve_trackers[_c] for _c in self.drag_refs.curve_list]
+        for _i, _pi, _b_in, _b_out in zip(self.drag_refs.curve_list,
+            _points[1:], _bearings[:-1], _bearings[1:]):
+
+            _c = self.curve_trackers[_i]
 
-        for _i, _c in enumerate(_curves):
+            #skip curves whose pi, bearings and validity have not changed,
+            #as update() also repaints the drag copy from is_invalid
+            _inputs = (_pi, _b_in, _b_out, _c.is_invalid)
 
-            _c.set_pi(_points[_i + 1])
-            _c.set_bearings(_bearings[_i], _bearings[_i + 1])
+            if self.drag_refs.curve_inputs.get(_i) == _inputs:
+                continue
+
+            self.drag_refs.curve_inputs[_i] = _inputs
+
+            _c.set_pi(_pi)
+            _c.set_bearings(_b_in, _b_out)
             _c.update()
 
         self.drag_refs.points = _points
 
+        return True
+
     def finish(self):
         """
         Cleanup the tracker
@@ -177,15 +177,15 @@ class CurveTracker(ContextTracker, Drag):
 
     def on_drag(self, user_data):
 
+        #skip all non-CurveTracker geometry
+        if not 'Curve' in user_data.obj.type_name:
+            return
+
         _xlate = user_data.matrix.getValue()[3]
         _point = Drag.drag_tracker.drag_position
 
         _mod_point = None
 
-        #skip all non-CurveTracker geometry
-        if not 'Curve' in user_data.obj.type_name:
-            return
-
         #iterate the possible drag points on the curve itself
         for _v in ['start', 'center', 'end']:
 
@@ -206,7 +206,7 @@ class CurveTracker(ContextTracker, Drag):
                 )
 
             if _mod_point:
-                exit
+                break
 
         #abort if this isn't a start, center, or end point.  PI and tangent
         #changes are handled in the alignment tracker
@@ -26,6 +26,7 @@ Create a Surface Object from FPO.
 
 import FreeCAD
 import Mesh, Part
+import numpy as np
 from pivy import coin
 from .surface_func import DataFunctions, ViewFunctions
 from freecad.trails import ICONPATH, line_patterns, geo_origin
@@ -125,51 +126,65 @@ class Surface(DataFunctions):
         Do something when a data property has changed.
         '''
         if prop == "Placement":
-            placement = obj.getPropertyByName(prop)
+            placement = obj.Placement
             copy_mesh = obj.Mesh.copy()
             copy_mesh.Placement = placement
             obj.Mesh = copy_mesh
 
         if prop =="PointGroups":
-            pgs = obj.getPropertyByName(prop)
             points = []
-            for pg in pgs:
+            for pg in obj.PointGroups:
                 points.extend(pg.Vectors)
 
             obj.Vectors = points
 
         if prop =="Vectors":
-            vectors = obj.getPropertyByName(prop)
+            vectors = obj.Vectors
             if vectors:
-                base = geo_origin.get(vectors[0]).Origin
+                geo_origin.get(vectors[0])
 
                 if len(vectors) > 2:
-                    pts = []
-                    for i in vectors:
-                        pts.append(i.sub(base))
-
-                    obj.Delaunay = self.triangulate(vectors)
+                    # Skip triangulation if points are unchanged
+                    data = self.points_array(vectors)
+                    key = self.points_key(data)
+                    if key != getattr(self, "_vectors_key", None):
+                        obj.Delaunay = self.triangulate(data)
+                        self._vectors_key = key
                 else:
                     obj.Mesh = Mesh.Mesh()
 
         if prop == "Delaunay" or prop == "MaxLength" or prop == "MaxAngle":
-            delaunay = obj.getPropertyByName("Delaunay")
-            vectors = obj.getPropertyByName("Vectors")
-            lmax = obj.getPropertyByName("MaxLength")
-            amax = obj.getPropertyByName("MaxAngle")
-            base = geo_origin.get().Origin
-
-            pts = []
-            for i in vectors:
-                pts.append(i.sub(base))
+            delaunay = obj.Delaunay
 
             if delaunay:
-                obj.Mesh = self.test_delaunay(
-                    pts, delaunay, lmax, amax)
+                lmax = obj.MaxLength
+                amax = obj.MaxAngle
+                base = geo_origin.get().Origin
+                data = self.points_array(obj.Vectors) - tuple(base)
+
+                # Skip mesh creation if triangulation inputs are unchanged
+                key = (self.points_key(data), hash(tuple(delaunay)),
+                    float(lmax), float(amax))
+                if key != getattr(self, "_mesh_key", None):
+                    mesh = self.test_delaunay(data, delaunay, lmax, amax)
+
+                    self._mesh_update = True
+                    try:
+                        obj.Mesh = mesh
+                    finally:
+                        self._mesh_update = False
+
+                    self._mesh_key = key
+
+        if prop == "Mesh":
+            # Mesh was replaced elsewhere (placement, edits), so the
+            # cached keys no longer describe it
+            if not getattr(self, "_mesh_update", False):
+                self._vectors_key = None
+                self._mesh_key = None
 
         if prop == "MinorInterval":
-            min_int = obj.getPropertyByName(prop)
-            obj.MajorInterval = min_int*5
+            obj.MajorInterval = obj.MinorInterval*5
 
     def execute(self, obj):
         '''
@@ -183,6 +198,19 @@ class Surface(DataFunctions):
 
         obj.BoundaryShapes = self.get_boundary(obj.Mesh)
 
+    def __getstate__(self):
+        """
+        Save variables to file.
+        """
+        return {"Type": self.Type}
+
+    def __setstate__(self, state):
+        """
+        Get variables from file.
+        """
+        if state:
+            self.Type = state.get("Type")
+
 
 class ViewProviderSurface(ViewFunctions):
     """
@@ -476,18 +504,21 @@ class ViewProviderSurface(ViewFunctions):
 
         if prop == "Mesh":
             mesh = obj.getPropertyByName("Mesh")
-            copy_mesh = mesh.copy()
-            copy_mesh.Placement.move(origin.Origin)
+            points, facets = mesh.Topology
 
-            triangles = []
-            for i in copy_mesh.Topology[1]:
-                triangles.extend(list(i))
-                triangles.append(-1)
+            # Move points to geo coordinates in one array operation
+            coords = DataFunctions.points_array(points) + tuple(origin.Origin)
 
-            self.geo_coords.point.values = copy_mesh.Topology[0]
-            self.triangles.coordIndex.values = triangles
+            # Facet indices, each closed with -1
+            triangles = np.full((len(facets), 4), -1, dtype=np.int32)
+            triangles[:, :3] = np.array(facets, dtype=np.int32).reshape(-1, 3)
+            triangles = triangles.ravel()
 
-            del copy_mesh
+            self.geo_coords.point.setNum(len(coords))
+            self.geo_coords.point.setValues(0, len(coords), coords.tolist())
+            self.triangles.coordIndex.setNum(len(triangles))
+            self.triangles.coordIndex.setValues(
+                0, len(triangles), triangles.tolist())
 
         if prop == "ContourShapes":
             contour_shape = obj.getPropertyByName(prop)
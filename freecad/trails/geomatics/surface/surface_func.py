@@ -27,8 +27,7 @@ Define Surface Object functions.
 import FreeCAD
 import Mesh, Part
 import numpy as np
-import copy, math
-import scipy.spatial
+import math
 
 import itertools as itools
 from collections import Counter
@@ -42,85 +41,95 @@ class DataFunctions:
         pass
 
     @staticmethod
-    def triangulate(points):
+    def points_array(points):
+        """
+        Convert a list of vectors to a (n, 3) coordinate array.
+        """
+        data = np.array(
+            [(point.x, point.y, point.z) for point in points], dtype=np.float64)
+
+        return data.reshape(-1, 3)
+
+    @staticmethod
+    def points_key(data):
+        """
+        Return a hash of point coordinates to detect unchanged inputs.
+        """
+        return hash(data.tobytes())
+
+    @staticmethod
+    def morton_order(xy):
+        """
+        Return indices which sort 2D points along a Z-order curve.
+        """
+        # Scale coordinates to 16 bit integer grid
+        span = np.ptp(xy, axis=0)
+        span[span == 0] = 1
+        grid = ((xy - xy.min(axis=0)) / span * 0xFFFF).astype(np.uint64)
+
+        # Interleave x and y bits
+        code = np.zeros(len(xy), dtype=np.uint64)
+        for bit in range(16):
+            shift = np.uint64(bit)
+            one = np.uint64(1)
+            code |= ((grid[:, 0] >> shift) & one) << (shift * np.uint64(2))
+            code |= ((grid[:, 1] >> shift) & one) << (
+                shift * np.uint64(2) + one)
+
+        return np.argsort(code, kind='stable')
+
+    @staticmethod
+    def triangulate(data):
         """
         Create 2D Delaunay triangulation.
         """
-        # Normalize points
-        base = points[0]
-        nor_points = []
-        for point in points:
-            nor_points.append(point.sub(base))
+        # Import SciPy on first use to keep workbench activation fast
+        import scipy.spatial
 
-        data = np.array(nor_points) 
+        # Normalize points
+        xy = data[:, :2] - data[0, :2]
 
         # Create delaunay triangulation
-        tri = scipy.spatial.Delaunay(data[:, :2])
-        delaunay = []
-
-        for i in tri.vertices.tolist():
-            delaunay.extend(i)
+        tri = scipy.spatial.Delaunay(xy)
 
-        return delaunay
+        return tri.simplices.ravel().tolist()
 
-    def test_delaunay(self, points, delaunay, lmax, amax):
+    def test_delaunay(self, data, delaunay, lmax, amax):
         """
         Test delaunay for max length and max angle.
         """
-        index = []
-        mesh_index = []
-
-        for i in range(0, len(delaunay), 3):
-            first, second,third = delaunay[i:i+3]
-
-            p1 = copy.deepcopy(points[first])
-            p2 = copy.deepcopy(points[second])
-            p3 = copy.deepcopy(points[third])
-            p1.z = p2.z = p3.z = 0
+        xy = data[:, :2]
+        triangles = np.array(delaunay, dtype=np.int64).reshape(-1, 3)
 
-            #Test triangle
-            if self.max_length(lmax, p1, p2, p3)\
-                and self.max_angle(amax,  p1, p2, p3):
-                index.extend([first, second, third])
+        # 2D triangle vertices
+        p1 = xy[triangles[:, 0]]
+        p2 = xy[triangles[:, 1]]
+        p3 = xy[triangles[:, 2]]
 
-        for i in index:
-            mesh_index.append(points[i])
+        # Edge vectors and lengths
+        edges = np.stack([p2 - p1, p3 - p2, p1 - p3])
+        lengths = np.sqrt(np.einsum('ijk,ijk->ij', edges, edges))
 
-        return Mesh.Mesh(mesh_index)
+        # Angle at each vertex between its two adjacent edges
+        dots = -np.einsum('ijk,ijk->ij', edges, np.roll(edges, 1, axis=0))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cosines = dots / (lengths * np.roll(lengths, 1, axis=0))
+        degrees = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
 
+        #Test triangles
+        # Written positively so NaN angles of vertical facets fail the test
+        valid = np.all(lengths <= float(lmax), axis=0)
+        valid &= np.all(degrees <= float(amax), axis=0)
 
-    @staticmethod
-    def max_length(lmax, p1, p2, p3):
-        """
-        Calculation of the 2D length between triangle edges
-        """
-        # Calculate length between triangle vertices
-        tri = [[p1, p2], [p2, p3], [p3, p1]]
-        for i, j in tri:
-            vec = i.sub(j)
+        # Order triangles along a Z-order curve for memory locality
+        triangles = triangles[valid]
+        if len(triangles):
+            centers = (p1[valid] + p2[valid] + p3[valid]) / 3
+            triangles = triangles[self.morton_order(centers)]
 
-            # Compare with input
-            if vec.Length > lmax:
-                return False
-        return True
+        mesh_index = data[triangles.ravel()].tolist()
 
-    @staticmethod
-    def max_angle(amax, p1, p2, p3):
-        """
-        Calculation of the 2D angle between triangle edges
-        """
-        # Calculate angle between triangle vertices
-        tri = [[p1, p2, p3], [p2, p3, p1], [p3, p1, p2]]
-        for j, k, l in tri:
-            vec1 = j.sub(k)
-            vec2 = l.sub(k)
-            radian = vec1.getAngle(vec2)
-            degree = math.degrees(radian)
-
-            # Compare with input
-            if degree > amax:
-                return False
-        return True
+        return Mesh.Mesh(mesh_index)
 
     def get_contours(self, mesh, major, minor):
         """
@@ -134,24 +143,36 @@ class DataFunctions:
         minor_contours = []
         major_contours = []
 
-        delta = minor
-        while delta < zmax:
-            if minor == 0: break
-            cross_sections = mesh.crossSections([((0, 0, delta*1000), (0, 0, 1))], 0.000001)
-
-            for point_list in cross_sections[0]:
+        # Integer indices of contour levels inside the elevation range
+        levels = []
+        if minor > 0:
+            levels = range(
+                max(math.ceil(zmin / minor), 1), math.ceil(zmax / minor))
+
+        # Every n'th level is major when the intervals divide evenly
+        ratio = round(major / minor) if minor > 0 else 0
+        if ratio > 0 and math.isclose(ratio * minor, major):
+            is_major = [i % ratio == 0 for i in levels]
+        else:
+            is_major = [i * minor % major == 0 for i in levels]
+
+        # Cut all contour levels with a single cross section call
+        planes = [((0, 0, i * minor * 1000), (0, 0, 1)) for i in levels]
+        cross_sections = mesh.crossSections(planes, 0.000001) if planes else []
+
+        for major_level, section in zip(is_major, cross_sections):
+            for point_list in section:
                 if len(point_list) > 3:
                     wire = Part.makePolygon(point_list)
 
-                    if delta % major == 0:
+                    if major_level:
                         major_contours.append(wire)
                     else:
                         minor_contours.append(wire)
 
                     del point_list
 
-            del cross_sections
-            delta += minor
+        del cross_sections
 
         majors = Part.makeCompound(major_contours)
         minors = Part.makeCompound(minor_contours)
@@ -221,25 +242,26 @@ class ViewFunctions:
         return points, vertices
 
     def elevation_analysis(self, mesh, ranges):
+        # Colors of 20% elevation bands from lowest to highest
+        colors = np.array([
+            (0.0, 1.0, 0.0),
+            (0.0, 1.0, 1.0),
+            (0.0, 0.0, 1.0),
+            (1.0, 0.0, 1.0),
+            (1.0, 0.0, 0.0)])
+
         scale = (mesh.BoundBox.ZMax - mesh.BoundBox.ZMin) / 100
-        colorlist = []
+        if scale == 0: scale = 1
 
-        for facet in mesh.Facets:
-            z = facet.Points[0][2] + facet.Points[1][2] + facet.Points[2][2]
-            zz = (z/3 - mesh.BoundBox.ZMin) / scale
+        points, facets = mesh.Topology
+        z = DataFunctions.points_array(points)[:, 2]
+        facets = np.array(facets, dtype=np.int64).reshape(-1, 3)
 
-            if zz < 20:
-                colorlist.append((0.0, 1.0, 0.0))
-            elif zz < 40:
-                colorlist.append((0.0, 1.0, 1.0))
-            elif zz < 60:
-                colorlist.append((0.0, 0.0, 1.0))
-            elif zz < 80:
-                colorlist.append((1.0, 0.0, 1.0))
-            else:
-                colorlist.append((1.0, 0.0, 0.0))
+        # Look up band color of each facet by its mean elevation
+        zz = (z[facets].mean(axis=1) - mesh.BoundBox.ZMin) / scale
+        band = np.clip(zz // 20, 0, 4).astype(np.int64)
 
-        return colorlist
+        return colors[band].tolist()
 
     def slope_analysis(self, mesh, ranges):
         colorlist = []